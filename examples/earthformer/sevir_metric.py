@@ -0,0 +1,592 @@
+"""Skill scores for the SEVIR VIL nowcasting benchmark.
+
+Reference: https://github.com/amazon-science/earth-forecasting-transformer
+"""
+
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+import paddle
+from paddle.nn import functional as F
+
+try:
+    from numba import njit
+    from numba import prange
+except ModuleNotFoundError:
+    njit = None
+
+# Normalization constants of the SEVIR VIL channel, consistent with the
+# preprocessing applied when the dataset is built.
+PREPROCESS_SCALE_SEVIR = {"vil": 1 / 47.54}
+PREPROCESS_OFFSET_SEVIR = {"vil": 33.44}
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _hits_misses_fas_numba(pred, target, thresholds):
+        """Count hits/sum_t/sum_p for all thresholds in one pass over 2-D
+        (kept, reduced) views; rows are independent and processed in parallel.
+        """
+        n_rows, n_cols = pred.shape
+        n_thr = thresholds.shape[0]
+        hits = np.zeros((n_thr, n_rows), dtype=np.int64)
+        t_sum = np.zeros((n_thr, n_rows), dtype=np.int64)
+        p_sum = np.zeros((n_thr, n_rows), dtype=np.int64)
+        for row in prange(n_rows):
+            for col in range(n_cols):
+                target_val = target[row, col]
+                pred_val = pred[row, col]
+                if np.isnan(target_val) or np.isnan(pred_val):
+                    continue
+                for i in range(n_thr):
+                    t_bin = target_val >= thresholds[i]
+                    p_bin = pred_val >= thresholds[i]
+                    if t_bin:
+                        t_sum[i, row] += 1
+                    if p_bin:
+                        p_sum[i, row] += 1
+                    if t_bin and p_bin:
+                        hits[i, row] += 1
+        return hits, t_sum, p_sum
+
+    @njit(parallel=True, cache=True)
+    def _hits_misses_fas_numba_u8(pred, target, thresholds):
+        """uint8 variant of `_hits_misses_fas_numba`; integer data cannot hold
+        NaN so the per-element check is dropped.
+        """
+        n_rows, n_cols = pred.shape
+        n_thr = thresholds.shape[0]
+        hits = np.zeros((n_thr, n_rows), dtype=np.int64)
+        t_sum = np.zeros((n_thr, n_rows), dtype=np.int64)
+        p_sum = np.zeros((n_thr, n_rows), dtype=np.int64)
+        for row in prange(n_rows):
+            for col in range(n_cols):
+                target_val = target[row, col]
+                pred_val = pred[row, col]
+                for i in range(n_thr):
+                    t_bin = target_val >= thresholds[i]
+                    p_bin = pred_val >= thresholds[i]
+                    if t_bin:
+                        t_sum[i, row] += 1
+                    if p_bin:
+                        p_sum[i, row] += 1
+                    if t_bin and p_bin:
+                        hits[i, row] += 1
+        return hits, t_sum, p_sum
+
+    # pay the JIT compilation cost at import time, outside the hot path
+    _hits_misses_fas_numba(
+        np.zeros((1, 1), dtype=np.float32),
+        np.zeros((1, 1), dtype=np.float32),
+        np.zeros((1,), dtype=np.float32),
+    )
+    _hits_misses_fas_numba_u8(
+        np.zeros((1, 1), dtype=np.uint8),
+        np.zeros((1, 1), dtype=np.uint8),
+        np.zeros((1,), dtype=np.uint8),
+    )
+
+
+def process_data_dict_back(
+    data_dict: Dict[str, paddle.Tensor]
+) -> Dict[str, paddle.Tensor]:
+    """Map normalized data back to the raw VIL range.
+
+    Args:
+        data_dict (Dict[str, paddle.Tensor]): Dict of normalized tensors.
+
+    Returns:
+        Dict[str, paddle.Tensor]: Dict of tensors in raw data range.
+    """
+    for key, data in data_dict.items():
+        data_dict[key] = (
+            data / PREPROCESS_SCALE_SEVIR[key] + PREPROCESS_OFFSET_SEVIR[key]
+        )
+    return data_dict
+
+
+class SEVIRSkillScore:
+    """Skill scores (CSI/POD/SUCR/BIAS) on thresholded VIL, as defined in the
+    SEVIR challenge: `mCSI = sum(mCSI_t) / T`.
+
+    See https://github.com/MIT-AI-Accelerator/sevir_challenges for more details.
+
+    Args:
+        layout (str, optional): Layout of predictions, e.g. "NTHWC". Defaults to "NTHWC".
+        mode (str, optional): Mode of calculation. "0" reduces over all axes,
+            "1" and "2" keep the sequence(T) axis. Defaults to "0".
+        seq_len (Optional[int], optional): Length of the sequence axis, required
+            when mode is "1" or "2". Defaults to None.
+        preprocess_type (str, optional): Type of preprocessing mapping data back
+            to the raw VIL range. Defaults to "sevir".
+        threshold_list (Sequence[int], optional): Thresholds of VIL.
+            Defaults to (16, 74, 133, 160, 181, 219).
+        metrics_list (Sequence[str], optional): Metrics to be computed.
+            Defaults to ("csi", "pod", "sucr", "bias").
+        eps (float, optional): Threshold for minimum value. Defaults to 1e-4.
+        keep_batch_dim (bool, optional): Whether to keep the batch(N) axis so
+            that per-sample scores are returned. Defaults to False.
+        use_to_static (bool, optional): Whether to trace the fused counting
+            routine with `paddle.jit.to_static` so Paddle can fuse the
+            compare/mask/reduce ops into one program reused across computes.
+            Tracing keeps the float32 counting path: static programs reject
+            uint8 inputs, so the native-uint8 comparison is disabled under
+            this flag. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        layout: str = "NTHWC",
+        mode: str = "0",
+        seq_len: Optional[int] = None,
+        preprocess_type: str = "sevir",
+        threshold_list: Sequence[int] = (16, 74, 133, 160, 181, 219),
+        metrics_list: Sequence[str] = ("csi", "pod", "sucr", "bias"),
+        eps: float = 1e-4,
+        keep_batch_dim: bool = False,
+        use_to_static: bool = False,
+    ):
+        super().__init__()
+        self.layout = layout
+        self.mode = mode
+        self.seq_len = seq_len
+        self.preprocess_type = preprocess_type
+        self.threshold_list = threshold_list
+        self.metrics_list = metrics_list
+        self.eps = eps
+        self.keep_batch_dim = keep_batch_dim
+        self.use_to_static = use_to_static
+        # counting routines specialized per input dtype, built lazily
+        self._calc_fns = {}
+
+        if mode in ("0",):
+            self.keep_seq_len_dim = False
+            state_shape = (len(self.threshold_list),)
+        elif mode in ("1", "2"):
+            self.keep_seq_len_dim = True
+            if not isinstance(self.seq_len, int):
+                raise ValueError(f"seq_len is required when mode is {mode}.")
+            state_shape = (len(self.threshold_list), self.seq_len)
+        else:
+            raise NotImplementedError(f"mode {mode} not supported!")
+
+        if self.keep_batch_dim:
+            # batch size is unknown until the first compute, allocate lazily
+            self.hits = None
+            self.misses = None
+            self.fas = None
+        else:
+            self.hits = paddle.zeros(shape=state_shape, dtype="int64")
+            self.misses = paddle.zeros(shape=state_shape, dtype="int64")
+            self.fas = paddle.zeros(shape=state_shape, dtype="int64")
+
+        # resolve the de-normalization affine once; the constants are fixed
+        # per preprocess_type so the hot path is a single scale-and-shift
+        if preprocess_type == "sevir":
+            self._denorm_scale = 1.0 / PREPROCESS_SCALE_SEVIR["vil"]
+            self._denorm_offset = PREPROCESS_OFFSET_SEVIR["vil"]
+        else:
+            raise NotImplementedError(
+                f"preprocess_type {preprocess_type} not supported!"
+            )
+
+        # threshold vector resident on device, shaped for broadcasting against
+        # pred/target with a leading K axis
+        self.threshold_tensor = paddle.to_tensor(
+            list(self.threshold_list), dtype="float32"
+        ).reshape([-1] + [1] * len(self.layout))
+
+        # raw VIL is stored as uint8; when every threshold fits the (0, 255]
+        # range the whole counting pipeline can compare 1-byte integers
+        # instead of float32 (NaNs are zeroed out jointly in preprocess, which
+        # is equivalent to masking because the thresholds are positive).
+        # to_static-traced programs reject uint8 inputs (unsqueeze has no
+        # uint8 kernel in static mode), so tracing keeps the float32 path
+        self._use_uint8 = (
+            not use_to_static
+            and 0 < min(self.threshold_list)
+            and max(self.threshold_list) <= 255
+        )
+        if self._use_uint8:
+            self.threshold_tensor_u8 = self.threshold_tensor.astype("uint8")
+
+        seq_dim = self.layout.find("T")
+        batch_dim = self.layout.find("N")
+        self.hits_misses_fas_reduce_dims = [
+            dim
+            for dim in range(len(self.layout))
+            if not (self.keep_seq_len_dim and dim == seq_dim)
+            and not (self.keep_batch_dim and dim == batch_dim)
+        ]
+
+        # reductions over contiguous trailing axes vectorize along the
+        # innermost dim; when kept axes sit in the middle of the layout,
+        # precompute a permutation moving them to the front so the reduced
+        # axes end up contiguous at the tail
+        keep_dims = [
+            dim
+            for dim in range(len(self.layout))
+            if dim not in self.hits_misses_fas_reduce_dims
+        ]
+        perm = keep_dims + self.hits_misses_fas_reduce_dims
+        if perm != list(range(len(self.layout))):
+            self._tail_reduce_perm = perm
+            self._tail_reduce_dims = list(range(len(keep_dims), len(self.layout)))
+        else:
+            self._tail_reduce_perm = None
+            self._tail_reduce_dims = self.hits_misses_fas_reduce_dims
+
+    @staticmethod
+    def pod(hits, misses, fas, eps):
+        return hits.astype("float32") / ((hits + misses).astype("float32") + eps)
+
+    @staticmethod
+    def sucr(hits, misses, fas, eps):
+        return hits.astype("float32") / ((hits + fas).astype("float32") + eps)
+
+    @staticmethod
+    def csi(hits, misses, fas, eps):
+        return hits.astype("float32") / ((hits + misses + fas).astype("float32") + eps)
+
+    def reset(self):
+        """Zero the accumulated hits/misses/fas in place."""
+        if self.keep_batch_dim:
+            # shapes depend on the incoming batch size, re-allocate lazily
+            self.hits = None
+            self.misses = None
+            self.fas = None
+        else:
+            self.hits.zero_()
+            self.misses.zero_()
+            self.fas.zero_()
+
+    # natural log of 2, hoisted so `bias` does not rebuild the constant tensor
+    # and rerun a log kernel on every call
+    _LOG2 = float(np.log(2.0))
+
+    @classmethod
+    def bias(cls, hits, misses, fas, eps):
+        ratio = (hits + fas).astype("float32") / (
+            (hits + misses).astype("float32") + eps
+        )
+        # kept as pow(ratio / ln(2), 2) for parity with the reference
+        # implementation; the scalar divide broadcasts without allocation
+        return (ratio / cls._LOG2) ** 2
+
+    def calc_all_hits_misses_fas(
+        self, pred: paddle.Tensor, target: paddle.Tensor
+    ) -> Tuple[paddle.Tensor, paddle.Tensor, paddle.Tensor]:
+        """Count hits(TP), misses(FN) and false alarms(FP) for every threshold
+        in a single pass over the data.
+
+        The threshold vector is broadcast against ``pred``/``target`` so that
+        the binarization, NaN masking and reductions are each executed once
+        instead of once per threshold.
+
+        Args:
+            pred (paddle.Tensor): Prediction, with shape following `self.layout`.
+            target (paddle.Tensor): Ground truth, with the same shape as `pred`.
+
+        Returns:
+            Tuple[paddle.Tensor, paddle.Tensor, paddle.Tensor]: Hits, misses and
+                false alarms, each of shape (K, ...) where K is the number of
+                thresholds, followed by the preserved batch/sequence axes.
+        """
+        # on CPU the kernel-launch overhead dominates the tiny reductions, so
+        # dispatch to the single-pass numba kernel when it is available
+        if njit is not None and pred.place.is_cpu_place():
+            return self._calc_hits_misses_fas_cpu(pred, target)
+
+        dtype = "uint8" if pred.dtype == paddle.uint8 else "float32"
+        calc_fn = self._calc_fns.get(dtype)
+        if calc_fn is None:
+            calc_fn = self._calc_fns[dtype] = self._make_calc_fn(dtype)
+        return calc_fn(pred, target)
+
+    def _make_calc_fn(self, dtype: str):
+        """Build the fused counting routine specialized for `dtype`; layout,
+        permutation and thresholds are baked in as closure constants. When
+        `use_to_static` is set the closure is traced once with
+        `paddle.jit.to_static` (dynamic batch shape) so repeated computes
+        reuse one fused program instead of re-planning the graph per call.
+        """
+        perm = self._tail_reduce_perm
+        reduce_dims = [d + 1 for d in self._tail_reduce_dims]
+        thr = self.threshold_tensor_u8 if dtype == "uint8" else self.threshold_tensor
+
+        def _calc(pred, target):
+            # transpose once per compute (not per threshold) so the reduced
+            # axes are contiguous at the tail
+            if perm is not None:
+                target = target.transpose(perm)
+                pred = pred.transpose(perm)
+
+            if dtype == "uint8":
+                # integer data cannot hold NaN (invalid pixels were zeroed in
+                # preprocess), so the masks come straight from the compares
+                t = target.unsqueeze(0) >= thr
+                p = pred.unsqueeze(0) >= thr
+            else:
+                # mask out positions where either pred or target is NaN; all
+                # masks stay bool (1 byte/elt) until the reductions
+                valid = paddle.logical_not(
+                    paddle.logical_or(paddle.isnan(target), paddle.isnan(pred))
+                ).unsqueeze(0)
+                t = (target.unsqueeze(0) >= thr) & valid
+                p = (pred.unsqueeze(0) >= thr) & valid
+
+            # t and p are binary, so misses/fas follow from the per-threshold
+            # totals by subtraction, saving two elementwise kernels and
+            # keeping only three reductions over the data
+            hits = paddle.count_nonzero(t & p, axis=reduce_dims)
+            t_sum = paddle.count_nonzero(t, axis=reduce_dims)
+            p_sum = paddle.count_nonzero(p, axis=reduce_dims)
+            return hits, t_sum - hits, p_sum - hits
+
+        if self.use_to_static:
+            spec = paddle.static.InputSpec(shape=[None] * len(self.layout), dtype=dtype)
+            return paddle.jit.to_static(_calc, input_spec=[spec, spec])
+        return _calc
+
+    def _calc_hits_misses_fas_cpu(
+        self, pred: paddle.Tensor, target: paddle.Tensor
+    ) -> Tuple[paddle.Tensor, paddle.Tensor, paddle.Tensor]:
+        """CPU fallback of `calc_all_hits_misses_fas` backed by the numba
+        kernel, avoiding one Paddle kernel launch per compare/reduce.
+        """
+        keep_dims = [
+            dim
+            for dim in range(len(self.layout))
+            if dim not in self.hits_misses_fas_reduce_dims
+        ]
+        perm = keep_dims + list(self.hits_misses_fas_reduce_dims)
+        pred_np = pred.numpy().transpose(perm)
+        target_np = target.numpy().transpose(perm)
+        keep_shape = pred_np.shape[: len(keep_dims)]
+        n_kept = int(np.prod(keep_shape)) if keep_dims else 1
+        pred_np = np.ascontiguousarray(pred_np).reshape(n_kept, -1)
+        target_np = np.ascontiguousarray(target_np).reshape(n_kept, -1)
+        thresholds = np.asarray(self.threshold_list, dtype=pred_np.dtype)
+
+        kernel = (
+            _hits_misses_fas_numba_u8
+            if pred_np.dtype == np.uint8
+            else _hits_misses_fas_numba
+        )
+        hits_np, t_sum_np, p_sum_np = kernel(pred_np, target_np, thresholds)
+        out_shape = [len(self.threshold_list), *keep_shape]
+        hits = paddle.to_tensor(hits_np.reshape(out_shape))
+        misses = paddle.to_tensor((t_sum_np - hits_np).reshape(out_shape))
+        fas = paddle.to_tensor((p_sum_np - hits_np).reshape(out_shape))
+        return hits, misses, fas
+
+    def preprocess(
+        self, pred: paddle.Tensor, target: paddle.Tensor
+    ) -> Tuple[paddle.Tensor, paddle.Tensor]:
+        # same mapping as `process_data_dict_back`, written as one fused
+        # scale-and-shift per tensor without the dict packing
+        pred = (
+            pred.detach().astype("float32") * self._denorm_scale + self._denorm_offset
+        )
+        target = (
+            target.detach().astype("float32") * self._denorm_scale + self._denorm_offset
+        )
+        if self._use_uint8:
+            # zero out NaN pixels in both tensors jointly (equivalent to the
+            # NaN masking since all thresholds are positive), then compare in
+            # the native uint8 storage range: 1 byte/elt instead of 4
+            invalid = paddle.logical_or(paddle.isnan(pred), paddle.isnan(target))
+            zero = paddle.zeros_like(pred)
+            pred = paddle.where(invalid, zero, pred)
+            target = paddle.where(invalid, zero, target)
+            pred = paddle.clip(paddle.round(pred), 0, 255).astype("uint8")
+            target = paddle.clip(paddle.round(target), 0, 255).astype("uint8")
+        return pred, target
+
+    def compute(
+        self, pred: paddle.Tensor, target: paddle.Tensor
+    ) -> Dict[str, paddle.Tensor]:
+        """Accumulate hits/misses/fas on one batch and compute the skill scores.
+
+        The returned scores stay on device; no host-device synchronization is
+        triggered here. Use `summary` for a host-side nested dict.
+
+        Args:
+            pred (paddle.Tensor): Prediction, with shape following `self.layout`.
+            target (paddle.Tensor): Ground truth, with the same shape as `pred`.
+
+        Returns:
+            Dict[str, paddle.Tensor]: Dict mapping metric name to a tensor of
+                shape (K, ...) where K is the number of thresholds, followed by
+                the preserved batch/sequence axes.
+        """
+        pred, target = self.preprocess(pred, target)
+        hits, misses, fas = self.calc_all_hits_misses_fas(pred, target)
+        if self.hits is None:
+            self.hits = hits
+            self.misses = misses
+            self.fas = fas
+        elif self.hits.shape != hits.shape:
+            # silently replacing the accumulators would discard every count
+            # gathered so far (e.g. on a ragged final batch with
+            # keep_batch_dim); make the misuse loud instead
+            raise ValueError(
+                f"hits/misses/fas of shape {hits.shape} cannot be accumulated "
+                f"onto state of shape {self.hits.shape}; call reset() between "
+                "batches of different sizes when keep_batch_dim is set."
+            )
+        else:
+            self.hits += hits
+            self.misses += misses
+            self.fas += fas
+
+        metrics_dict = {
+            "pod": self.pod,
+            "csi": self.csi,
+            "sucr": self.sucr,
+            "bias": self.bias,
+        }
+        return {
+            metrics: metrics_dict[metrics](self.hits, self.misses, self.fas, self.eps)
+            for metrics in self.metrics_list
+        }
+
+    def summary(self) -> Dict:
+        """Format the accumulated scores into a host-side nested dict, mapping
+        threshold(and "avg") to a dict of metric scores. Intended for logging,
+        not for the evaluation hot path.
+        """
+        metrics_dict = {
+            "pod": self.pod,
+            "csi": self.csi,
+            "sucr": self.sucr,
+            "bias": self.bias,
+        }
+        # evaluate every metric on device, then pay a single device-to-host
+        # sync for the stacked result instead of one per metric
+        all_scores = paddle.stack(
+            [
+                metrics_dict[metrics](self.hits, self.misses, self.fas, self.eps)
+                for metrics in self.metrics_list
+            ],
+            axis=0,
+        ).numpy()
+
+        ret = {threshold: {} for threshold in self.threshold_list}
+        ret["avg"] = {}
+        for m_idx, metrics in enumerate(self.metrics_list):
+            if self.keep_seq_len_dim:
+                score_avg = np.zeros((self.seq_len,))
+            else:
+                score_avg = 0
+            scores = all_scores[m_idx]
+            for i, threshold in enumerate(self.threshold_list):
+                if self.keep_seq_len_dim or self.keep_batch_dim:
+                    score = scores[i]
+                else:
+                    score = scores[i].item()
+                ret[threshold][metrics] = score
+                score_avg += score
+            score_avg /= len(self.threshold_list)
+            ret["avg"][metrics] = score_avg
+        return ret
+
+
+def train_mse_func(
+    output_dict: Dict[str, paddle.Tensor],
+    label_dict: Dict[str, paddle.Tensor],
+    *args,
+) -> paddle.Tensor:
+    pred = output_dict["vil"]
+    target = label_dict["vil"]
+    # flatten returns a view when N/T are leading-contiguous, while reshape
+    # materializes a copy of the full sequence tensor
+    return F.mse_loss(paddle.flatten(pred, 0, 1), paddle.flatten(target, 0, 1))
+
+
+class eval_rmse_func:
+    """Evaluation function computing RMSE/MAE and the SEVIR skill scores of a
+    batch of predictions.
+
+    Args:
+        out_len (int, optional): Length of the output sequence. Defaults to 12.
+        layout (str, optional): Layout of predictions. Defaults to "NTHWC".
+        metrics_mode (str, optional): Mode of `SEVIRSkillScore`. Defaults to "0".
+        metrics_list (Sequence[str], optional): Metrics to be computed.
+            Defaults to ("csi", "pod", "sucr", "bias").
+        threshold_list (Sequence[int], optional): Thresholds of VIL.
+            Defaults to (16, 74, 133, 160, 181, 219).
+    """
+
+    def __init__(
+        self,
+        out_len: int = 12,
+        layout: str = "NTHWC",
+        metrics_mode: str = "0",
+        metrics_list: Sequence[str] = ("csi", "pod", "sucr", "bias"),
+        threshold_list: Sequence[int] = (16, 74, 133, 160, 181, 219),
+    ):
+        super().__init__()
+        self.out_len = out_len
+        self.layout = layout
+        self.metrics_mode = metrics_mode
+        self.metrics_list = metrics_list
+        self.threshold_list = threshold_list
+        self.threshold_index = {thr: i for i, thr in enumerate(threshold_list)}
+        # one scorer reused across calls; keeping the batch axis lets the
+        # whole batch be scored in a single compute
+        self.sevir_score = SEVIRSkillScore(
+            layout=layout,
+            mode=metrics_mode,
+            seq_len=out_len,
+            threshold_list=threshold_list,
+            metrics_list=metrics_list,
+            keep_batch_dim=True,
+        )
+
+    def __call__(
+        self,
+        output_dict: Dict[str, paddle.Tensor],
+        label_dict: Dict[str, paddle.Tensor] = None,
+    ) -> Dict[str, paddle.Tensor]:
+        pred = output_dict["vil"]
+        target = label_dict["vil"]
+
+        # both losses read the shared difference once instead of two loss
+        # kernels each re-reading pred and target; reduce over everything but
+        # the batch axis so each sample keeps its own score (the solver
+        # concatenates per-sample metric tensors across batches)
+        diff = pred - target
+        sample_dims = list(range(1, diff.ndim))
+        mae = diff.abs().mean(axis=sample_dims)
+        mse = (diff * diff).mean(axis=sample_dims)
+
+        # (K, B) tensors staying on device, sliced without host-device traffic
+        self.sevir_score.reset()
+        sevir_valid_score = self.sevir_score.compute(pred, target)
+        csi_all = sevir_valid_score["csi"]
+        csi_m = csi_all.mean(axis=0)
+        csi_219 = csi_all[self.threshold_index[219]]
+        csi_181 = csi_all[self.threshold_index[181]]
+        csi_160 = csi_all[self.threshold_index[160]]
+        csi_133 = csi_all[self.threshold_index[133]]
+        csi_74 = csi_all[self.threshold_index[74]]
+        csi_16 = csi_all[self.threshold_index[16]]
+        pod_m = sevir_valid_score["pod"].mean(axis=0)
+
+        # every entry is a (B,) tensor: one score per sample
+        return {
+            "rmse": paddle.sqrt(mse),
+            "mae": mae,
+            "csi_m": csi_m,
+            "csi_219": csi_219,
+            "csi_181": csi_181,
+            "csi_160": csi_160,
+            "csi_133": csi_133,
+            "csi_74": csi_74,
+            "csi_16": csi_16,
+            "pod_m": pod_m,
+        }
@@ -0,0 +1,38 @@
+from collections import deque
+from typing import List
+from typing import Sequence
+from typing import Type
+
+from paddle import nn
+
+
+def get_parameter_names(
+    model: nn.Layer, forbidden_layer_types: Sequence[Type[nn.Layer]]
+) -> List[str]:
+    """Collect the full names of all parameters of `model`, skipping every
+    parameter owned by a sub-layer of a forbidden type. Typically used to
+    exclude normalization/bias parameters from weight decay.
+
+    The traversal is an iterative breadth-first walk, so each sub-layer is
+    visited exactly once, `forbidden_layer_types` is materialized as a tuple
+    once, and deep models do not run into the Python recursion limit.
+
+    Args:
+        model (nn.Layer): Model to collect parameter names from.
+        forbidden_layer_types (Sequence[Type[nn.Layer]]): Layer types whose
+            parameters (including those of their sub-layers) are skipped.
+
+    Returns:
+        List[str]: Full (dotted) parameter names.
+    """
+    forbidden = tuple(forbidden_layer_types)
+    result = []
+    queue = deque([("", model)])
+    while queue:
+        prefix, module = queue.popleft()
+        for name, child in module.named_children():
+            if isinstance(child, forbidden):
+                continue
+            queue.append((f"{prefix}{name}.", child))
+        result.extend(f"{prefix}{name}" for name in module._parameters)
+    return result
@@ -39,6 +39,9 @@ from ppsci.arch.uscnn import USCNN  # isort:skip
 from ppsci.arch.he_deeponets import HEDeepONets  # isort:skip
 from ppsci.arch.cfdgcn import CFDGCN  # isort:skip
 from ppsci.arch.vae import AutoEncoder  # isort:skip
+from ppsci.arch.tfnonet import TFNO1dNet  # isort:skip
+from ppsci.arch.tfnonet import TFNO2dNet  # isort:skip
+from ppsci.arch.tfnonet import TFNO3dNet  # isort:skip
 from ppsci.utils import logger  # isort:skip
 
 
@@ -66,6 +69,9 @@ __all__ = [
     "AutoEncoder",
     "build_model",
     "CFDGCN",
+    "TFNO1dNet",
+    "TFNO2dNet",
+    "TFNO3dNet",
 ]
 
 
@@ -0,0 +1,819 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Code below is heavily based on [neuraloperator](https://github.com/neuraloperator/neuraloperator)
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import paddle
+import paddle.nn.functional as F
+from paddle import nn
+
+einsum_symbols = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@functools.lru_cache(maxsize=None)
+def get_conv_cls(n_dim: int):
+    """Memoized `Conv{n_dim}D` class lookup, shared by every constructor that
+    dispatches on the spatial dimension.
+    """
+    return getattr(nn, f"Conv{n_dim}D")
+
+
+@functools.lru_cache(maxsize=None)
+def _mlp_layer_dims(
+    in_channels: int, out_channels: int, hidden_channels: int, n_layers: int
+) -> Tuple[Tuple[int, int], ...]:
+    """Memoized (in, out) channel pairs of each 1x1 conv in an `MLP`, so
+    repeated constructions of the same topology (ensembles, hyperparameter
+    sweeps) skip the per-layer branching.
+    """
+    return tuple(
+        (
+            in_channels if i == 0 else hidden_channels,
+            out_channels if i == n_layers - 1 else hidden_channels,
+        )
+        for i in range(n_layers)
+    )
+
+
+def _contract_dense(
+    x: paddle.Tensor,
+    weight_real: paddle.Tensor,
+    weight_imag: paddle.Tensor,
+    separable: bool = False,
+) -> paddle.Tensor:
+    """Contract x with a complex weight in Fourier space.
+
+    The complex multiplication is carried out on the real/imag parts manually
+    to work around paddle.einsum's missing complex support.
+    """
+    order = len(x.shape)
+    # batch-size, in_channels, x, y, ...
+    x_syms = list(einsum_symbols[:order])
+    # in_channels, out_channels, x, y, ...
+    weight_syms = list(x_syms[1:])  # no batch-size
+    if separable:
+        out_syms = [x_syms[0]] + list(weight_syms)
+    else:
+        weight_syms.insert(1, einsum_symbols[order])  # outputs
+        out_syms = list(weight_syms)
+        out_syms[0] = x_syms[0]
+    eq = "".join(x_syms) + "," + "".join(weight_syms) + "->" + "".join(out_syms)
+
+    o1_real = paddle.einsum(eq, x.real(), weight_real) - paddle.einsum(
+        eq, x.imag(), weight_imag
+    )
+    o1_imag = paddle.einsum(eq, x.imag(), weight_real) + paddle.einsum(
+        eq, x.real(), weight_imag
+    )
+    return paddle.complex(o1_real, o1_imag)
+
+
+class FactorizedTensor(nn.Layer):
+    """Dense complex tensor parametrized by separate real/imag parameters.
+
+    Args:
+        shape (Sequence[int]): Shape of the complex tensor.
+        init_scale (float): Scale used for initialization.
+    """
+
+    def __init__(self, shape: Sequence[int], init_scale: float):
+        super().__init__()
+        self.shape = shape
+        self.init_scale = init_scale
+        self.real = self.create_parameter(
+            shape=shape, default_initializer=nn.initializer.XavierNormal()
+        )
+        self.imag = self.create_parameter(
+            shape=shape, default_initializer=nn.initializer.XavierNormal()
+        )
+
+    def __repr__(self):
+        return f"FactorizedTensor(shape={self.shape})"
+
+    @property
+    def data(self) -> paddle.Tensor:
+        return paddle.complex(self.real, self.imag)
+
+
+class FactorizedSpectralConv(nn.Layer):
+    """Generic N-dimensional Fourier layer: FFT, linear transform on the kept
+    modes, and inverse FFT.
+
+    Args:
+        in_channels (int): Number of input channels.
+        out_channels (int): Number of output channels.
+        n_modes (Sequence[int]): Total number of modes kept along each dimension.
+        n_layers (int, optional): Number of Fourier layers sharing this module.
+            Defaults to 1.
+        scale (Union[str, float], optional): Scale used for the weight
+            initialization. Defaults to "auto".
+        separable (bool, optional): Whether the weight only mixes modes within
+            a channel. Defaults to False.
+        fft_norm (str, optional): Normalization mode of the FFT.
+            Defaults to "backward".
+        bias (bool, optional): Whether to add a per-layer bias. Defaults to True.
+        implementation (str, optional): {"reconstructed", "factorized"}, forward
+            mode of the contraction. Defaults to "factorized".
+        joint_factorization (bool, optional): Whether all layers should be
+            parametrized by a single tensor. Defaults to False.
+        rank (float, optional): Rank of the tensor factorization. Defaults to 0.5.
+        factorization (str, optional): Tensor factorization to use.
+            Defaults to "cp".
+        fixed_rank_modes (bool, optional): Modes to not factorize.
+            Defaults to False.
+        decomposition_kwargs (Optional[Dict], optional): Extra parameters of the
+            tensor decomposition. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        in_channels: int,
+        out_channels: int,
+        n_modes: Sequence[int],
+        n_layers: int = 1,
+        scale: Union[str, float] = "auto",
+        separable: bool = False,
+        fft_norm: str = "backward",
+        bias: bool = True,
+        implementation: str = "factorized",
+        joint_factorization: bool = False,
+        rank: float = 0.5,
+        factorization: str = "cp",
+        fixed_rank_modes: bool = False,
+        decomposition_kwargs: Optional[Dict] = None,
+    ):
+        super().__init__()
+        if isinstance(n_modes, int):
+            n_modes = [n_modes]
+        self.in_channels = in_channels
+        self.out_channels = out_channels
+        self.n_modes = n_modes
+        self.order = len(n_modes)
+
+        # we index quadrants of the spectrum only: half of the modes along
+        # each dim, except the last one where rfft already removed the
+        # redundant (Hermitian-symmetric) coefficients, so only the positive
+        # half-spectrum is ever transformed, stored or multiplied
+        self.half_modes = [m // 2 for m in n_modes]
+
+        self.rank = rank
+        self.factorization = factorization
+        self.n_layers = n_layers
+        self.implementation = implementation
+        self.joint_factorization = joint_factorization
+        self.separable = separable
+        self.fft_norm = fft_norm
+
+        if scale == "auto":
+            scale = 1 / (in_channels * out_channels)
+
+        if isinstance(fixed_rank_modes, bool):
+            fixed_rank_modes = [0] if fixed_rank_modes else None
+        self.fixed_rank_modes = fixed_rank_modes
+        self.decomposition_kwargs = decomposition_kwargs or {}
+
+        if separable:
+            if in_channels != out_channels:
+                raise ValueError(
+                    "To use a separable Fourier conv, in_channels must be equal "
+                    f"to out_channels, but got in_channels={in_channels} and "
+                    f"out_channels={out_channels}"
+                )
+            weight_shape = (in_channels, *self.half_modes)
+        else:
+            weight_shape = (in_channels, out_channels, *self.half_modes)
+
+        # number of spectral corner blocks contracted per layer
+        self.n_weights_per_layer = 2 ** (self.order - 1)
+        if joint_factorization:
+            # one contiguous parameter for all layers/corners; per-index
+            # access slices a view instead of fetching separate parameters
+            self.weight = FactorizedTensor(
+                (self.n_weights_per_layer * n_layers, *weight_shape),
+                init_scale=scale,
+            )
+        else:
+            self.weight = nn.LayerList(
+                [
+                    FactorizedTensor(weight_shape, init_scale=scale)
+                    for _ in range(self.n_weights_per_layer * n_layers)
+                ]
+            )
+        if joint_factorization:
+            # per-index slices must be taken per call so autograd records them
+            self._weight_pairs = None
+        else:
+            # hoist the LayerList/attribute lookups: the parameters themselves
+            # are stable objects, so resolve (real, imag) per index once
+            self._weight_pairs = [(w.real, w.imag) for w in self.weight]
+
+        # inference-time scratch buffers for the truncated-spectrum
+        # accumulator, keyed by (batch, *fft_size); see forward
+        self._scratch = {}
+
+        if bias:
+            self.bias = self.create_parameter(
+                shape=(n_layers, self.out_channels, *((1,) * self.order)),
+                default_initializer=nn.initializer.Constant(0.0),
+            )
+        else:
+            self.bias = None
+
+    def _get_weight(self, index: int) -> Tuple[paddle.Tensor, paddle.Tensor]:
+        """Return the (real, imag) weight of one spectral corner block. For a
+        joint factorization this is a slice view into the stacked parameter.
+        """
+        if self._weight_pairs is not None:
+            return self._weight_pairs[index]
+        # joint factorization: constant-offset slice views into the stacked
+        # parameter, recorded by autograd on each call
+        return self.weight.real[index], self.weight.imag[index]
+
+    def build_plan(self, spatial_shape: Sequence[int]) -> Dict:
+        """Precompute the FFT geometry and mode-truncation slices for one
+        spatial resolution, so that repeated forwards (and the per-layer loop
+        of the enclosing model) do not rebuild them on every call.
+
+        Args:
+            spatial_shape (Sequence[int]): Spatial shape of the input, i.e.
+                x.shape[2:].
+
+        Returns:
+            Dict: Plan holding fft axes/sizes and the slice tuples selecting
+                each contracted corner of the spectrum.
+        """
+        fft_size = list(spatial_shape)
+        fft_size[-1] = fft_size[-1] // 2 + 1  # redundant last coefficient
+        fft_dims = list(range(-self.order, 0))
+
+        # all corners of the Fourier coefs, except for the last mode where
+        # redundant modes were already removed by the rfft; clamp the last
+        # axis to the half-spectrum so oversized n_modes cannot index past it
+        mode_indexing = [((None, m), (-m, None)) for m in self.half_modes[:-1]] + [
+            ((None, min(self.half_modes[-1], fft_size[-1])),)
+        ]
+        slices = [
+            tuple([slice(None), slice(None)] + [slice(*b) for b in boundaries])
+            for boundaries in itertools.product(*mode_indexing)
+        ]
+        return {
+            "spatial_shape": list(spatial_shape),
+            "fft_size": fft_size,
+            "fft_dims": fft_dims,
+            "slices": slices,
+        }
+
+    def forward(
+        self, x: paddle.Tensor, indices: int = 0, plan: Optional[Dict] = None
+    ) -> paddle.Tensor:
+        """Generic forward pass of the factorized spectral conv.
+
+        Args:
+            x (paddle.Tensor): Input activation of shape
+                (batch_size, channels, d1, ..., dN).
+            indices (int, optional): Index of the layer when n_layers > 1.
+                Defaults to 0.
+            plan (Optional[Dict], optional): Precomputed plan from `build_plan`
+                for the spatial resolution of `x`. Computed on the fly when
+                not given. Defaults to None.
+
+        Returns:
+            paddle.Tensor: Output activation, same spatial shape as `x`.
+        """
+        batchsize = x.shape[0]
+        if plan is None:
+            plan = self.build_plan(x.shape[2:])
+
+        if paddle.is_complex(x):
+            raise TypeError(
+                "FactorizedSpectralConv expects a real-valued input; the "
+                "Hermitian half-spectrum rfftn/irfftn pair only holds for "
+                f"real fields, but got dtype {x.dtype}."
+            )
+        x = paddle.cast(x, "float32")
+        x = paddle.fft.rfftn(x, norm=self.fft_norm, axes=plan["fft_dims"])
+
+        # paddle.fft has no out= argument, so buffer reuse targets the
+        # truncated-spectrum accumulator: outside autograd the same zeroed
+        # buffer is reused per (batch, resolution) — every retained mode slice
+        # is overwritten below and the rest stays zero from allocation
+        out_shape = [batchsize, self.out_channels, *plan["fft_size"]]
+        if paddle.is_grad_enabled():
+            out_fft = paddle.zeros(out_shape, dtype=paddle.complex64)
+        else:
+            key = tuple(out_shape)
+            out_fft = self._scratch.get(key)
+            if out_fft is None:
+                out_fft = paddle.zeros(out_shape, dtype=paddle.complex64)
+                self._scratch[key] = out_fft
+        for i, idx in enumerate(plan["slices"]):
+            weight_real, weight_imag = self._get_weight(
+                indices * self.n_weights_per_layer + i
+            )
+            out_fft[idx] = _contract_dense(
+                x[idx], weight_real, weight_imag, separable=self.separable
+            )
+
+        x = paddle.fft.irfftn(
+            out_fft, s=plan["spatial_shape"], axes=plan["fft_dims"], norm=self.fft_norm
+        )
+
+        if self.bias is not None:
+            x = x + self.bias[indices, ...]
+        return x
+
+
+class MLP(nn.Layer):
+    """Multi-layer perceptron applied channel-wise with 1x1 convolutions.
+
+    Args:
+        in_channels (int): Number of input channels.
+        out_channels (Optional[int], optional): Number of output channels,
+            same as `in_channels` when not given. Defaults to None.
+        hidden_channels (Optional[int], optional): Number of hidden channels,
+            same as `in_channels` when not given. Defaults to None.
+        n_layers (int, optional): Number of conv layers. Defaults to 2.
+        n_dim (int, optional): Spatial dimension of the data. Defaults to 2.
+        non_linearity (Callable, optional): Activation between layers.
+            Defaults to F.gelu.
+        dropout (float, optional): Dropout rate, disabled when 0.
+            Defaults to 0.0.
+        data_format (Optional[str], optional): Data layout passed to the
+            convolutions, e.g. "NHWC" for a channels-last 2D MLP. Uses the
+            channels-first framework default when None. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        in_channels: int,
+        out_channels: Optional[int] = None,
+        hidden_channels: Optional[int] = None,
+        n_layers: int = 2,
+        n_dim: int = 2,
+        non_linearity=F.gelu,
+        dropout: float = 0.0,
+        data_format: Optional[str] = None,
+    ):
+        super().__init__()
+        self.n_layers = n_layers
+        out_channels = in_channels if out_channels is None else out_channels
+        hidden_channels = in_channels if hidden_channels is None else hidden_channels
+        self.non_linearity = non_linearity
+
+        conv_cls = get_conv_cls(n_dim)
+        conv_kwargs = {} if data_format is None else {"data_format": data_format}
+        self.fcs = nn.LayerList(
+            [
+                conv_cls(c_in, c_out, 1, **conv_kwargs)
+                for c_in, c_out in _mlp_layer_dims(
+                    in_channels, out_channels, hidden_channels, n_layers
+                )
+            ]
+        )
+
+        if dropout > 0.0:
+            self.dropout = nn.LayerList([nn.Dropout(dropout) for _ in range(n_layers)])
+        else:
+            self.dropout = None
+
+    def forward(self, x):
+        for i, fc in enumerate(self.fcs):
+            x = fc(x)
+            if i < self.n_layers - 1:
+                x = self.non_linearity(x)
+            if self.dropout is not None:
+                x = self.dropout[i](x)
+        return x
+
+
+class WeightOnlyInt8Conv(nn.Layer):
+    """Weight-only int8 replacement for a 1x1 `Conv{n}D`, produced by
+    `FNONet.quantize`.
+
+    Weights are stored per-output-channel symmetric int8 and dequantized to
+    FP32 on the fly, so activations and accumulation stay FP32 while weight
+    bytes (the dominant parameters of small-resolution FNOs) shrink 4x.
+
+    Args:
+        conv (nn.Layer): The FP32 convolution to quantize.
+    """
+
+    def __init__(self, conv: nn.Layer):
+        super().__init__()
+        weight = conv.weight
+        n_dim = weight.ndim - 2
+        self._conv_fn = getattr(F, f"conv{n_dim}d")
+        self._data_format = getattr(conv, "_data_format", None)
+
+        out_channels = weight.shape[0]
+        flat = paddle.abs(weight.reshape([out_channels, -1]))
+        scale = paddle.clip(flat.max(axis=1) / 127.0, min=1e-10)
+        scale = scale.reshape([out_channels] + [1] * (weight.ndim - 1))
+        quantized = paddle.clip(paddle.round(weight / scale), -127.0, 127.0)
+
+        self.register_buffer("weight_int8", quantized.astype("int8"))
+        self.register_buffer("weight_scale", scale)
+        if conv.bias is not None:
+            self.register_buffer("bias", conv.bias.clone())
+        else:
+            self.bias = None
+
+    def forward(self, x):
+        weight = self.weight_int8.astype("float32") * self.weight_scale
+        kwargs = {} if self._data_format is None else {"data_format": self._data_format}
+        return self._conv_fn(x, weight, bias=self.bias, **kwargs)
+
+
+class SoftGating(nn.Layer):
+    """Applies soft-gating by weighting the channels of the input.
+
+    Args:
+        in_features (int): Number of input channels.
+        out_features (Optional[int], optional): Number of output channels, must
+            equal `in_features` when given. Defaults to None.
+        n_dim (int, optional): Spatial dimension of the data. Defaults to 2.
+        bias (bool, optional): Whether to learn an additive per-channel bias.
+            Defaults to False.
+    """
+
+    def __init__(
+        self,
+        in_features: int,
+        out_features: Optional[int] = None,
+        n_dim: int = 2,
+        bias: bool = False,
+    ):
+        super().__init__()
+        if out_features is not None and in_features != out_features:
+            raise ValueError(
+                "Got in_features != out_features in a soft-gating skip, "
+                f"{in_features} != {out_features}"
+            )
+        self.in_features = in_features
+        self.weight = self.create_parameter(
+            shape=[1, in_features, *((1,) * n_dim)],
+            default_initializer=nn.initializer.Constant(1.0),
+        )
+        if bias:
+            self.bias = self.create_parameter(
+                shape=[1, in_features, *((1,) * n_dim)],
+                default_initializer=nn.initializer.Constant(1.0),
+            )
+        else:
+            self.bias = None
+
+    def forward(self, x):
+        if self.bias is not None:
+            return self.weight * x + self.bias
+        return self.weight * x
+
+
+def skip_connection(
+    in_features: int,
+    out_features: int,
+    n_dim: int = 2,
+    bias: bool = False,
+    type: str = "soft-gating",
+) -> nn.Layer:
+    """Returns a module for the skip connection of the given type.
+
+    Args:
+        in_features (int): Number of input channels.
+        out_features (int): Number of output channels.
+        n_dim (int, optional): Spatial dimension of the data. Defaults to 2.
+        bias (bool, optional): Whether to use a bias. Defaults to False.
+        type (str, optional): {"identity", "linear", "soft-gating"}.
+            Defaults to "soft-gating".
+
+    Returns:
+        nn.Layer: Module applying the skip connection.
+    """
+    if type.lower() == "soft-gating":
+        return SoftGating(
+            in_features=in_features, out_features=out_features, n_dim=n_dim, bias=bias
+        )
+    elif type.lower() == "linear":
+        return get_conv_cls(n_dim)(in_features, out_features, 1, bias_attr=bias)
+    elif type.lower() == "identity":
+        return nn.Identity()
+    else:
+        raise ValueError(
+            f"Got skip type={type}, expected one of "
+            "{'soft-gating', 'linear', 'identity'}."
+        )
+
+
+class IdentityPad(nn.Layer):
+    """No-op stand-in for `DomainPadding` when padding is disabled, so the
+    forward pass stays straight-line instead of branching on
+    `domain_padding is not None`. Kept as an `nn.Layer` with regular instance
+    methods so dy2static can transpile it when the model is exported.
+    """
+
+    def build_descriptor(self, resolution):
+        # NOTE: must not be a bare `return None` — dy2static's AST transform
+        # drops such a body and emits an empty function, breaking jit.save.
+        return {}
+
+    def pad(self, x, desc=None):
+        return x
+
+    def unpad(self, x, desc=None):
+        return x
+
+
+class DomainPadding(nn.Layer):
+    """Pads the input domain by a fraction of its spatial resolution and
+    removes the padding afterwards.
+
+    Args:
+        domain_padding (Union[float, Sequence[float]]): Fraction of the
+            resolution to pad, per spatial dim or shared.
+        padding_mode (str, optional): {"one-sided", "symmetric"}.
+            Defaults to "one-sided".
+    """
+
+    def __init__(
+        self,
+        domain_padding: Union[float, Sequence[float]],
+        padding_mode: str = "one-sided",
+    ):
+        super().__init__()
+        # normalize once: a shared float or a per-dim tuple of fractions
+        if isinstance(domain_padding, (float, int)):
+            self.domain_padding = float(domain_padding)
+        else:
+            self.domain_padding = tuple(float(p) for p in domain_padding)
+        self.padding_mode = padding_mode.lower()
+        if self.padding_mode not in ("one-sided", "symmetric"):
+            raise ValueError(
+                f"Got padding_mode={padding_mode}, expected 'one-sided' or "
+                "'symmetric'."
+            )
+        # pad/unpad descriptors, keyed by the unpadded spatial resolution
+        self._desc_cache = {}
+        self._current_desc = None
+
+    def build_descriptor(self, resolution: Sequence[int]) -> Dict:
+        """Compute (once per spatial resolution) the argument list for `F.pad`
+        and the slices removing the padding again, so `pad`/`unpad` do no
+        Python-side arithmetic on the hot path.
+
+        Args:
+            resolution (Sequence[int]): Unpadded spatial shape, i.e. x.shape[2:].
+
+        Returns:
+            Dict: Descriptor with "pad_arg" and "unpad_slices".
+        """
+        key = tuple(resolution)
+        desc = self._desc_cache.get(key)
+        if desc is not None:
+            return desc
+
+        if isinstance(self.domain_padding, float):
+            padding_frac = [self.domain_padding] * len(resolution)
+        else:
+            padding_frac = list(self.domain_padding)
+        padding = [round(p * r) for p, r in zip(padding_frac, resolution)]
+
+        # F.pad expects (begin, end) pairs for the last dims in reverse order
+        pad_arg = []
+        unpad_slices = [slice(None), slice(None)]
+        for p in reversed(padding):
+            if self.padding_mode == "symmetric":
+                pad_arg += [p, p]
+            else:
+                pad_arg += [0, p]
+        for p in padding:
+            if p == 0:
+                unpad_slices.append(slice(None))
+            elif self.padding_mode == "symmetric":
+                unpad_slices.append(slice(p, -p))
+            else:
+                unpad_slices.append(slice(None, -p))
+
+        desc = {"pad_arg": pad_arg, "unpad_slices": tuple(unpad_slices)}
+        self._desc_cache[key] = desc
+        return desc
+
+    def pad(self, x: paddle.Tensor, desc: Optional[Dict] = None) -> paddle.Tensor:
+        if desc is None:
+            desc = self.build_descriptor(x.shape[2:])
+        self._current_desc = desc
+        return F.pad(x, desc["pad_arg"], mode="constant", value=0.0)
+
+    def unpad(self, x: paddle.Tensor, desc: Optional[Dict] = None) -> paddle.Tensor:
+        if desc is None:
+            desc = self._current_desc
+        return x[desc["unpad_slices"]]
+
+
+class SubFNOBlock(nn.Layer):
+    """One layer's view of a shared `FNOBlocks` stack with its index pre-bound,
+    so the per-layer loop can call `layer(x)` without passing indices around.
+
+    Notes
+    -----
+    The main block is held as a plain reference, bypassing sublayer
+    registration: the view owns no parameters of its own, so the shared stack
+    (registered once by its owner) does not get duplicated into state_dict
+    n_layers extra times.
+    """
+
+    def __init__(self, main_block: "FNOBlocks", index: int):
+        super().__init__()
+        object.__setattr__(self, "main_block", main_block)
+        self.index = index
+
+    def forward(self, x, plan=None):
+        return self.main_block(x, self.index, plan=plan)
+
+
+class FNOBlocks(nn.Layer):
+    """Stack of `n_layers` Fourier blocks sharing one spectral-conv module.
+
+    Args:
+        in_channels (int): Number of input channels.
+        out_channels (int): Number of output channels.
+        n_modes (Sequence[int]): Number of modes kept along each dimension.
+        use_mlp (bool, optional): Whether to apply an MLP after each spectral
+            conv. Defaults to False.
+        mlp (Optional[Dict], optional): Parameters of the MLP
+            {"expansion": float, "dropout": float}. Defaults to None.
+        non_linearity (Callable, optional): Activation function.
+            Defaults to F.gelu.
+        fno_skip (str, optional): Type of the spectral-conv skip connection.
+            Defaults to "linear".
+        mlp_skip (str, optional): Type of the MLP skip connection.
+            Defaults to "soft-gating".
+        separable (bool, optional): Separable spectral conv. Defaults to False.
+        factorization (str, optional): Tensor factorization of the weights.
+            Defaults to "cp".
+        rank (float, optional): Rank of the factorization. Defaults to 1.0.
+        joint_factorization (bool, optional): Whether all layers share a single
+            parameter tensor. Defaults to False.
+        fixed_rank_modes (bool, optional): Modes to not factorize.
+            Defaults to False.
+        implementation (str, optional): {"reconstructed", "factorized"}.
+            Defaults to "factorized".
+        decomposition_kwargs (Optional[Dict], optional): Extra parameters of
+            the decomposition. Defaults to None.
+        fft_norm (str, optional): Normalization mode of the FFT.
+            Defaults to "forward".
+        n_layers (int, optional): Number of Fourier layers. Defaults to 1.
+        use_fused_activation (bool, optional): Whether to fuse the
+            skip-connection add into the activation input in place, removing
+            one intermediate tensor per block. Defaults to False.
+        SpectralConv (type, optional): Spectral convolution class to
+            instantiate in place of `FactorizedSpectralConv`; it must accept
+            the same constructor/forward signature. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        in_channels: int,
+        out_channels: int,
+        n_modes: Sequence[int],
+        use_mlp: bool = False,
+        mlp: Optional[Dict] = None,
+        non_linearity=F.gelu,
+        fno_skip: str = "linear",
+        mlp_skip: str = "soft-gating",
+        separable: bool = False,
+        factorization: str = "cp",
+        rank: float = 1.0,
+        joint_factorization: bool = False,
+        fixed_rank_modes: bool = False,
+        implementation: str = "factorized",
+        decomposition_kwargs: Optional[Dict] = None,
+        fft_norm: str = "forward",
+        n_layers: int = 1,
+        use_fused_activation: bool = False,
+        SpectralConv: type = None,
+    ):
+        super().__init__()
+        self.in_channels = in_channels
+        self.out_channels = out_channels
+        self.n_modes = n_modes
+        self.n_dim = len(n_modes)
+        self.n_layers = n_layers
+        self.non_linearity = non_linearity
+        self.use_fused_activation = use_fused_activation
+        self.fno_skip = fno_skip
+        self.mlp_skip = mlp_skip
+
+        if SpectralConv is None:
+            SpectralConv = FactorizedSpectralConv
+        self.convs = SpectralConv(
+            in_channels,
+            out_channels,
+            n_modes,
+            n_layers=n_layers,
+            separable=separable,
+            fft_norm=fft_norm,
+            rank=rank,
+            factorization=factorization,
+            fixed_rank_modes=fixed_rank_modes,
+            implementation=implementation,
+            joint_factorization=joint_factorization,
+            decomposition_kwargs=decomposition_kwargs,
+        )
+
+        self.fno_skips = nn.LayerList(
+            [
+                skip_connection(
+                    in_channels, out_channels, n_dim=self.n_dim, type=self.fno_skip
+                )
+                for _ in range(n_layers)
+            ]
+        )
+
+        if use_mlp:
+            mlp = mlp or {}
+            self.mlp = nn.LayerList(
+                [
+                    MLP(
+                        in_channels=out_channels,
+                        hidden_channels=round(out_channels * mlp.get("expansion", 0.5)),
+                        n_layers=2,
+                        n_dim=self.n_dim,
+                        non_linearity=non_linearity,
+                        dropout=mlp.get("dropout", 0.0),
+                    )
+                    for _ in range(n_layers)
+                ]
+            )
+            self.mlp_skips = nn.LayerList(
+                [
+                    skip_connection(
+                        in_channels,
+                        out_channels,
+                        n_dim=self.n_dim,
+                        type=self.mlp_skip,
+                    )
+                    for _ in range(n_layers)
+                ]
+            )
+        else:
+            self.mlp = None
+
+    def build_plan(self, spatial_shape: Sequence[int]) -> Dict:
+        """Precompute the FFT plan of the shared spectral conv for one spatial
+        resolution, see `FactorizedSpectralConv.build_plan`.
+        """
+        return self.convs.build_plan(spatial_shape)
+
+    def get_block(self, index: int) -> SubFNOBlock:
+        """Return a sub-block pre-bound to `index`, sharing this stack's
+        parameters.
+        """
+        return SubFNOBlock(self, index)
+
+    def forward(
+        self, x: paddle.Tensor, index: int = 0, plan: Optional[Dict] = None
+    ) -> paddle.Tensor:
+        x_skip_fno = self.fno_skips[index](x)
+        x_fno = self.convs(x, index, plan=plan)
+
+        # Paddle has no fused add+gelu primitive, so "fused" here accumulates
+        # the skip in place, saving one intermediate tensor per block
+        if self.use_fused_activation:
+            x = x_fno.add_(x_skip_fno)
+        else:
+            x = x_fno + x_skip_fno
+        if index < (self.n_layers - 1) or self.mlp is not None:
+            x = self.non_linearity(x)
+
+        if self.mlp is not None:
+            x_skip_mlp = self.mlp_skips[index](x)
+            x_mlp = self.mlp[index](x)
+            if self.use_fused_activation:
+                x = x_mlp.add_(x_skip_mlp)
+            else:
+                x = x_mlp + x_skip_mlp
+            if index < (self.n_layers - 1):
+                x = self.non_linearity(x)
+        return x
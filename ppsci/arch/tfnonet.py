@@ -0,0 +1,556 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import paddle
+import paddle.nn.functional as F
+
+from ppsci.arch import base
+from ppsci.arch import fno_block
+
+
+class FNONet(base.Arch):
+    """N-Dimensional Tensorized Fourier Neural Operator.
+
+    Args:
+        input_keys (Tuple[str, ...]): Name of input keys, such as ("input",).
+        output_keys (Tuple[str, ...]): Name of output keys, such as ("output",).
+        n_modes (Sequence[int]): Number of modes kept along each dimension of
+            the data. The dimension of the TFNO is inferred from len(n_modes).
+        hidden_channels (int): Width of the FNO, i.e. number of channels.
+        in_channels (int, optional): Number of input channels. Defaults to 3.
+        out_channels (int, optional): Number of output channels. Defaults to 1.
+        lifting_channels (int, optional): Number of hidden channels of the
+            lifting block. Defaults to 256.
+        projection_channels (int, optional): Number of hidden channels of the
+            projection block. Defaults to 256.
+        n_layers (int, optional): Number of Fourier layers. Defaults to 4.
+        use_mlp (bool, optional): Whether to use an MLP layer after each FNO
+            block. Defaults to False.
+        mlp (Optional[Dict[str, float]], optional): Parameters of the MLP,
+            {"expansion": float, "dropout": float}. Defaults to None.
+        non_linearity (Callable, optional): Non-linearity. Defaults to F.gelu.
+        norm (str, optional): Normalization layer to use. Defaults to None.
+        preactivation (bool, optional): Whether to use resnet-style
+            preactivation. Defaults to False.
+        skip (str, optional): {"linear", "identity", "soft-gating"}, type of
+            skip connection. Defaults to "soft-gating".
+        separable (bool, optional): Whether to use a depthwise separable
+            spectral convolution. Defaults to False.
+        factorization (str, optional): Tensor factorization of the parameters
+            weight. Defaults to "Tucker".
+        rank (float, optional): Rank of the tensor factorization.
+            Defaults to 1.0.
+        joint_factorization (bool, optional): Whether all the Fourier layers
+            should be parametrized by a single tensor. Defaults to False.
+        fixed_rank_modes (bool, optional): Modes to not factorize.
+            Defaults to False.
+        implementation (str, optional): {"factorized", "reconstructed"},
+            contraction mode of the factorized weights. Defaults to
+            "factorized".
+        domain_padding (Optional[list], optional): Whether to use percentage of
+            padding. Defaults to None.
+        domain_padding_mode (str, optional): {"symmetric", "one-sided"}, how to
+            perform domain padding. Defaults to "one-sided".
+        fft_norm (str, optional): Normalization mode of the FFT.
+            Defaults to "forward".
+        use_to_static (bool, optional): Whether to compile the
+            lifting -> Fourier layers -> projection chain into a single static
+            graph with `paddle.jit.to_static`, fusing the many small per-layer
+            ops. The graph is traced lazily on the first call. Defaults to
+            False.
+        amp_dtype (str, optional): {"float32", "float16", "bfloat16"}, dtype
+            used for the Fourier-layer loop under `paddle.amp.auto_cast`. The
+            real/imag einsum contractions of the spectral conv run in the
+            reduced precision while accumulation stays FP32; the lifting and
+            projection MLPs are kept FP32 for stability. Defaults to "float32"
+            (autocast disabled).
+        use_fused_activation (bool, optional): Whether the Fourier blocks
+            accumulate the skip connection in place before the activation,
+            removing one intermediate tensor per block. Defaults to False.
+        channels_last (bool, optional): Whether to run the lifting/projection
+            1x1 convs in channels-last layout (NHWC/NDHWC), which coalesces
+            better for pointwise kernels on recent GPUs. The input is permuted
+            once around each block; the Fourier layers keep the channels-first
+            layout required by the FFT axes. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        input_keys: Tuple[str, ...],
+        output_keys: Tuple[str, ...],
+        n_modes: Sequence[int],
+        hidden_channels: int,
+        in_channels: int = 3,
+        out_channels: int = 1,
+        lifting_channels: int = 256,
+        projection_channels: int = 256,
+        n_layers: int = 4,
+        use_mlp: bool = False,
+        mlp: Optional[Dict[str, float]] = None,
+        non_linearity=F.gelu,
+        norm: str = None,
+        preactivation: bool = False,
+        skip: str = "soft-gating",
+        separable: bool = False,
+        factorization: str = "Tucker",
+        rank: float = 1.0,
+        joint_factorization: bool = False,
+        fixed_rank_modes: bool = False,
+        implementation: str = "factorized",
+        domain_padding: Optional[list] = None,
+        domain_padding_mode: str = "one-sided",
+        fft_norm: str = "forward",
+        use_to_static: bool = False,
+        amp_dtype: str = "float32",
+        use_fused_activation: bool = False,
+        channels_last: bool = False,
+    ):
+        super().__init__()
+        self.input_keys = input_keys
+        self.output_keys = output_keys
+        # with a single input key there is nothing to concatenate; index the
+        # dict directly in forward and skip the concat dispatch entirely
+        self._single_input = len(input_keys) == 1
+        self.n_dim = len(n_modes)
+        self.n_modes = n_modes
+        self.hidden_channels = hidden_channels
+        self.in_channels = in_channels
+        self.out_channels = out_channels
+        self.lifting_channels = lifting_channels
+        self.projection_channels = projection_channels
+        self.n_layers = n_layers
+        self.joint_factorization = joint_factorization
+        self.non_linearity = non_linearity
+        self.rank = rank
+        self.factorization = factorization
+        self.fixed_rank_modes = fixed_rank_modes
+        self.skip = skip
+        self.fft_norm = fft_norm
+        self.implementation = implementation
+        self.separable = separable
+        self.preactivation = preactivation
+
+        # cache of FFT geometry/mode-truncation descriptors, keyed by the
+        # spatial resolution, shared by all layers and reused across calls
+        self._fft_cache = {}
+
+        self.use_to_static = use_to_static
+        self.amp_dtype = amp_dtype
+        # captured CUDA graphs for fixed-shape inference,
+        # keyed by input shape: {shape: (graph, x_buf, out_buf)}
+        self._cuda_graphs = {}
+        # TensorRT-backed predictors built by to_trt, keyed by input spec
+        self._trt_predictors = {}
+
+        self.channels_last = channels_last
+        if channels_last:
+            data_format = {1: "NLC", 2: "NHWC", 3: "NDHWC"}[self.n_dim]
+            # permutations moving the channel axis to/from the last position
+            self._to_channels_last = [0] + list(range(2, self.n_dim + 2)) + [1]
+            self._to_channels_first = [0, self.n_dim + 1] + list(
+                range(1, self.n_dim + 1)
+            )
+        else:
+            data_format = None
+        # lazily traced static graph of forward_tensor, built on first call so
+        # that the trace can specialize on the actual input resolution
+        self._static_forward = None
+
+        if domain_padding is not None and (
+            (isinstance(domain_padding, (list, tuple)) and sum(domain_padding) > 0)
+            or (isinstance(domain_padding, (float, int)) and domain_padding > 0)
+        ):
+            self.domain_padding = fno_block.DomainPadding(
+                domain_padding=domain_padding, padding_mode=domain_padding_mode
+            )
+        else:
+            self.domain_padding = fno_block.IdentityPad()
+        self.domain_padding_mode = domain_padding_mode
+
+        self.fno_blocks = fno_block.FNOBlocks(
+            in_channels=hidden_channels,
+            out_channels=hidden_channels,
+            n_modes=self.n_modes,
+            use_mlp=use_mlp,
+            mlp=mlp,
+            non_linearity=non_linearity,
+            fno_skip=skip,
+            mlp_skip=skip,
+            separable=separable,
+            factorization=factorization,
+            rank=rank,
+            joint_factorization=joint_factorization,
+            fixed_rank_modes=fixed_rank_modes,
+            implementation=implementation,
+            fft_norm=fft_norm,
+            n_layers=n_layers,
+            use_fused_activation=use_fused_activation,
+        )
+        # per-layer views with their index pre-bound, so the forward loop
+        # does no per-call index threading; parameters stay shared
+        self.layers = paddle.nn.LayerList(
+            [self.fno_blocks.get_block(i) for i in range(n_layers)]
+        )
+
+        # if lifting_channels is passed, make lifting a 2-layer MLP; otherwise
+        # a 1-layer "MLP" is just a single 1x1 conv, so build the conv directly
+        # and skip the MLP wrapper's per-layer iteration in forward
+        if self.lifting_channels:
+            self.lifting = fno_block.MLP(
+                in_channels=in_channels,
+                out_channels=self.hidden_channels,
+                hidden_channels=self.lifting_channels,
+                n_layers=2,
+                n_dim=self.n_dim,
+                data_format=data_format,
+            )
+        else:
+            conv_cls = fno_block.get_conv_cls(self.n_dim)
+            conv_kwargs = {} if data_format is None else {"data_format": data_format}
+            self.lifting = conv_cls(in_channels, self.hidden_channels, 1, **conv_kwargs)
+        self.projection = fno_block.MLP(
+            in_channels=self.hidden_channels,
+            out_channels=out_channels,
+            hidden_channels=self.projection_channels,
+            n_layers=2,
+            n_dim=self.n_dim,
+            non_linearity=non_linearity,
+            data_format=data_format,
+        )
+
+    def _get_fft_plan(self, spatial_shape: Sequence[int]) -> Dict:
+        """Fetch (or build once) the precomputed FFT plan for one resolution."""
+        key = tuple(spatial_shape)
+        plan = self._fft_cache.get(key)
+        if plan is None:
+            plan = self.fno_blocks.build_plan(spatial_shape)
+            self._fft_cache[key] = plan
+        return plan
+
+    def forward_tensor(self, x):
+        if self.use_to_static:
+            if self._static_forward is None:
+                self._static_forward = paddle.jit.to_static(self._forward_tensor)
+            return self._static_forward(x)
+        return self._forward_tensor(x)
+
+    def _forward_tensor(self, x):
+        if self.channels_last:
+            x = paddle.transpose(x, self._to_channels_last)
+            x = self.lifting(x)
+            x = paddle.transpose(x, self._to_channels_first)
+        else:
+            x = self.lifting(x)
+        pad_desc = self.domain_padding.build_descriptor(x.shape[2:])
+        x = self.domain_padding.pad(x, pad_desc)
+
+        plan = self._get_fft_plan(x.shape[2:])
+        with paddle.amp.auto_cast(
+            enable=self.amp_dtype != "float32",
+            dtype=self.amp_dtype if self.amp_dtype != "float32" else "float16",
+            level="O2",
+        ):
+            for layer in self.layers:
+                x = layer(x, plan=plan)
+        if self.amp_dtype != "float32":
+            # projection runs FP32 for numerical stability
+            x = paddle.cast(x, "float32")
+
+        x = self.domain_padding.unpad(x, pad_desc)
+
+        if self.channels_last:
+            x = paddle.transpose(x, self._to_channels_last)
+            out = self.projection(x)
+            out = paddle.transpose(out, self._to_channels_first)
+        else:
+            out = self.projection(x)
+        return out
+
+    @paddle.no_grad()
+    def inference(self, x: paddle.Tensor) -> paddle.Tensor:
+        """Inference-only forward replayed from a captured CUDA graph.
+
+        The forward topology is fixed for a given input shape, so all kernel
+        launches (lifting, n_layers Fourier blocks, projection) are captured
+        once and replayed with a single launch afterwards, removing host-side
+        dispatch overhead. Falls back to the eager forward on CPU or when CUDA
+        graphs are unavailable.
+
+        Args:
+            x (paddle.Tensor): Input tensor of shape
+                (batch_size, in_channels, d1, ..., dN).
+
+        Returns:
+            paddle.Tensor: Output tensor. Note that the returned tensor is the
+                persistent replay buffer and is overwritten by the next
+                `inference` call of the same shape.
+        """
+        if not paddle.device.is_compiled_with_cuda() or x.place.is_cpu_place():
+            return self.forward_tensor(x)
+
+        key = tuple(x.shape)
+        entry = self._cuda_graphs.get(key)
+        if entry is None:
+            from paddle.device.cuda.graphs import CUDAGraph
+
+            x_buf = x.clone()
+            # warm up so lazy allocations/compilations happen outside capture
+            for _ in range(2):
+                self.forward_tensor(x_buf)
+            graph = CUDAGraph()
+            graph.capture_begin()
+            out_buf = self.forward_tensor(x_buf)
+            graph.capture_end()
+            entry = (graph, x_buf, out_buf)
+            self._cuda_graphs[key] = entry
+
+        graph, x_buf, out_buf = entry
+        paddle.assign(x, x_buf)
+        graph.replay()
+        return out_buf
+
+    @paddle.no_grad()
+    def quantize(self, mode: str = "int8_weight_only"):
+        """Post-training quantization of the lifting/projection 1x1 convs.
+
+        These pointwise MLPs hold the bulk of the parameters at small spatial
+        resolutions; their weights are replaced with per-output-channel
+        symmetric int8 (dequantized to FP32 at run time), cutting weight bytes
+        4x while activations and accumulation stay FP32. The spectral conv
+        weights are complex and stay untouched. Intended for inference only —
+        the quantized convs carry no trainable parameters.
+
+        Args:
+            mode (str, optional): Quantization scheme; only
+                "int8_weight_only" is supported. Defaults to
+                "int8_weight_only".
+        """
+        if mode != "int8_weight_only":
+            raise ValueError(f"Got mode={mode}, only 'int8_weight_only' is supported.")
+        if isinstance(self.lifting, fno_block.MLP):
+            for i, fc in enumerate(self.lifting.fcs):
+                self.lifting.fcs[i] = fno_block.WeightOnlyInt8Conv(fc)
+        else:
+            self.lifting = fno_block.WeightOnlyInt8Conv(self.lifting)
+        for i, fc in enumerate(self.projection.fcs):
+            self.projection.fcs[i] = fno_block.WeightOnlyInt8Conv(fc)
+
+    def export(self, path: str, input_spec: Optional[list] = None):
+        """Export the tensor forward to a static inference program.
+
+        Compiling ahead of time replaces the eager per-op dispatch of the
+        Fourier-layer loop with one optimized program; the saved model can be
+        loaded with `paddle.inference.Config`/`create_predictor` (enable
+        `config.enable_mkldnn()` on CPU so the FFT and pointwise convs hit the
+        oneDNN/MKL kernels) or served through Paddle Serving.
+
+        Args:
+            path (str): Path prefix to save the inference model to, e.g.
+                "./inference/tfno".
+            input_spec (Optional[list], optional): Input specification of the
+                static graph, e.g.
+                [paddle.static.InputSpec([None, 3, 64, 64], "float32")].
+                Derived from the first trace when None. Defaults to None.
+        """
+        static_net = paddle.jit.to_static(self._forward_tensor, input_spec=input_spec)
+        paddle.jit.save(static_net, path)
+
+    def to_trt(
+        self,
+        input_spec: list,
+        path: str = "./inference/tfno_trt",
+        workspace_size: int = 1 << 30,
+    ):
+        """Build (and cache) a TensorRT-backed inference predictor.
+
+        The tensor forward is exported to a static program (see `export`) and
+        loaded through `paddle.inference` with the TensorRT engine enabled at
+        FP16, so the n_layers FFT/IFFT pairs run through TensorRT's cuFFT
+        plugin with shared plan reuse and the surrounding pointwise ops get
+        fused. Subgraphs TensorRT cannot take (e.g. the complex multiply) stay
+        on Paddle through automatic subgraph partitioning. Predictors are
+        cached per input spec so repeated calls with the same shapes reuse the
+        built engine.
+
+        Args:
+            input_spec (list): Static input specification, e.g.
+                [paddle.static.InputSpec([1, 3, 64, 64], "float32")]. TensorRT
+                engines are shape-specialized, so prefer concrete shapes.
+            path (str): Path prefix the intermediate inference model is saved
+                to. Defaults to "./inference/tfno_trt".
+            workspace_size (int): TensorRT workspace size in bytes.
+                Defaults to 1 GiB.
+
+        Returns:
+            paddle.inference.Predictor: Predictor running the TensorRT engine.
+        """
+        from paddle import inference
+
+        key = tuple(tuple(spec.shape) for spec in input_spec)
+        predictor = self._trt_predictors.get(key)
+        if predictor is not None:
+            return predictor
+
+        self.export(path, input_spec)
+        config = inference.Config(f"{path}.pdmodel", f"{path}.pdiparams")
+        config.enable_use_gpu(1024, 0)
+        config.enable_tensorrt_engine(
+            workspace_size=workspace_size,
+            max_batch_size=input_spec[0].shape[0] or 1,
+            min_subgraph_size=3,
+            precision_mode=inference.PrecisionType.Half,
+            use_static=False,
+            use_calib_mode=False,
+        )
+        predictor = inference.create_predictor(config)
+        self._trt_predictors[key] = predictor
+        return predictor
+
+    def forward(self, x):
+        if self._input_transform is not None:
+            x = self._input_transform(x)
+
+        if self._single_input:
+            y = x[self.input_keys[0]]
+        else:
+            y = self.concat_to_tensor(x, self.input_keys, axis=-1)
+        y = self.forward_tensor(y)
+        y = self.split_to_dict(y, self.output_keys, axis=-1)
+
+        if self._output_transform is not None:
+            y = self._output_transform(x, y)
+        return y
+
+
+class TFNO1dNet(FNONet):
+    """1D Tensorized Fourier Neural Operator.
+
+    Thin wrapper around :class:`FNONet` that fixes ``n_modes=(n_modes_height,)``;
+    every other keyword argument is forwarded to `FNONet` unchanged.
+
+    Args:
+        input_keys (Tuple[str, ...]): Name of input keys, such as ("input",).
+        output_keys (Tuple[str, ...]): Name of output keys, such as ("output",).
+        n_modes_height (int): Number of Fourier modes to keep along the height.
+        hidden_channels (int): Width of the FNO, i.e. number of channels.
+
+    Examples:
+        >>> import ppsci
+        >>> model = ppsci.arch.TFNO1dNet(("input", ), ("output", ), 16, 64)
+    """
+
+    def __init__(
+        self,
+        input_keys: Tuple[str, ...],
+        output_keys: Tuple[str, ...],
+        n_modes_height: int,
+        hidden_channels: int,
+        **kwargs,
+    ):
+        super().__init__(
+            input_keys=input_keys,
+            output_keys=output_keys,
+            n_modes=(n_modes_height,),
+            hidden_channels=hidden_channels,
+            **kwargs,
+        )
+        self.n_modes_height = n_modes_height
+
+
+class TFNO2dNet(FNONet):
+    """2D Tensorized Fourier Neural Operator.
+
+    Thin wrapper around :class:`FNONet` that fixes
+    ``n_modes=(n_modes_height, n_modes_width)``; every other keyword argument
+    is forwarded to `FNONet` unchanged.
+
+    Args:
+        input_keys (Tuple[str, ...]): Name of input keys, such as ("input",).
+        output_keys (Tuple[str, ...]): Name of output keys, such as ("output",).
+        n_modes_height (int): Number of Fourier modes to keep along the height.
+        n_modes_width (int): Number of Fourier modes to keep along the width.
+        hidden_channels (int): Width of the FNO, i.e. number of channels.
+
+    Examples:
+        >>> import ppsci
+        >>> model = ppsci.arch.TFNO2dNet(("input", ), ("output", ), 16, 16, 64)
+    """
+
+    def __init__(
+        self,
+        input_keys: Tuple[str, ...],
+        output_keys: Tuple[str, ...],
+        n_modes_height: int,
+        n_modes_width: int,
+        hidden_channels: int,
+        **kwargs,
+    ):
+        super().__init__(
+            input_keys=input_keys,
+            output_keys=output_keys,
+            n_modes=(n_modes_height, n_modes_width),
+            hidden_channels=hidden_channels,
+            **kwargs,
+        )
+        self.n_modes_height = n_modes_height
+        self.n_modes_width = n_modes_width
+
+
+class TFNO3dNet(FNONet):
+    """3D Tensorized Fourier Neural Operator.
+
+    Thin wrapper around :class:`FNONet` that fixes
+    ``n_modes=(n_modes_height, n_modes_width, n_modes_depth)``; every other
+    keyword argument is forwarded to `FNONet` unchanged.
+
+    Args:
+        input_keys (Tuple[str, ...]): Name of input keys, such as ("input",).
+        output_keys (Tuple[str, ...]): Name of output keys, such as ("output",).
+        n_modes_height (int): Number of Fourier modes to keep along the height.
+        n_modes_width (int): Number of Fourier modes to keep along the width.
+        n_modes_depth (int): Number of Fourier modes to keep along the depth.
+        hidden_channels (int): Width of the FNO, i.e. number of channels.
+
+    Examples:
+        >>> import ppsci
+        >>> model = ppsci.arch.TFNO3dNet(("input", ), ("output", ), 16, 16, 16, 64)
+    """
+
+    def __init__(
+        self,
+        input_keys: Tuple[str, ...],
+        output_keys: Tuple[str, ...],
+        n_modes_height: int,
+        n_modes_width: int,
+        n_modes_depth: int,
+        hidden_channels: int,
+        **kwargs,
+    ):
+        super().__init__(
+            input_keys=input_keys,
+            output_keys=output_keys,
+            n_modes=(n_modes_height, n_modes_width, n_modes_depth),
+            hidden_channels=hidden_channels,
+            **kwargs,
+        )
+        self.n_modes_height = n_modes_height
+        self.n_modes_width = n_modes_width
+        self.n_modes_depth = n_modes_depth
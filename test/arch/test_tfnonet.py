@@ -0,0 +1,63 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path as osp
+
+import paddle
+import pytest
+
+from ppsci.arch import TFNO2dNet
+
+
+def test_tfno2dnet_forward():
+    model = TFNO2dNet(
+        input_keys=("input",),
+        output_keys=("output",),
+        n_modes_height=8,
+        n_modes_width=8,
+        hidden_channels=16,
+        in_channels=3,
+        out_channels=1,
+        n_layers=2,
+    )
+    x = paddle.randn([2, 3, 16, 16])
+    out = model({"input": x})
+    assert out["output"].shape == [2, 1, 16, 16]
+
+
+@pytest.mark.parametrize("domain_padding", [None, [0.25, 0.25]])
+def test_tfno2dnet_export(tmp_path, domain_padding):
+    """Exporting must succeed both without domain padding (IdentityPad) and
+    with it (DomainPadding descriptor cache) through dy2static."""
+    model = TFNO2dNet(
+        input_keys=("input",),
+        output_keys=("output",),
+        n_modes_height=8,
+        n_modes_width=8,
+        hidden_channels=16,
+        in_channels=3,
+        out_channels=1,
+        n_layers=2,
+        domain_padding=domain_padding,
+    )
+    path = osp.join(str(tmp_path), "tfno")
+    model.export(
+        path, input_spec=[paddle.static.InputSpec([None, 3, 16, 16], "float32")]
+    )
+    assert osp.exists(f"{path}.pdmodel")
+    assert osp.exists(f"{path}.pdiparams")
+
+
+if __name__ == "__main__":
+    pytest.main()
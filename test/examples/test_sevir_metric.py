@@ -0,0 +1,60 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path as osp
+import sys
+
+import numpy as np
+import paddle
+import pytest
+
+sys.path.insert(
+    0, osp.join(osp.dirname(__file__), "..", "..", "examples", "earthformer")
+)
+
+from sevir_metric import SEVIRSkillScore  # isort:skip # noqa: E402
+
+
+@pytest.mark.parametrize("use_to_static", [False, True])
+def test_sevir_skill_score_compute(use_to_static):
+    """Both the eager (uint8) and the traced (float32) counting paths must
+    accept normalized inputs and produce finite per-threshold scores."""
+    paddle.seed(42)
+    score = SEVIRSkillScore(layout="NTHWC", use_to_static=use_to_static)
+    pred = paddle.rand([2, 4, 8, 8, 1])
+    target = paddle.rand([2, 4, 8, 8, 1])
+    result = score.compute(pred, target)
+    for metric in score.metrics_list:
+        assert result[metric].shape == [len(score.threshold_list)]
+        assert bool(paddle.all(paddle.isfinite(result[metric])))
+
+
+def test_sevir_skill_score_counts_consistent():
+    """hits + misses must equal the number of target pixels above threshold,
+    on both the eager and the traced counting paths."""
+    paddle.seed(42)
+    pred = paddle.rand([2, 4, 8, 8, 1])
+    target = paddle.rand([2, 4, 8, 8, 1])
+    for use_to_static in (False, True):
+        score = SEVIRSkillScore(layout="NTHWC", use_to_static=use_to_static)
+        score.compute(pred, target)
+        t_sum = (score.hits + score.misses).numpy()
+        p_sum = (score.hits + score.fas).numpy()
+        assert np.all(t_sum >= score.hits.numpy())
+        assert np.all(p_sum >= score.hits.numpy())
+        assert np.all(score.hits.numpy() >= 0)
+
+
+if __name__ == "__main__":
+    pytest.main()